@@ -9,8 +9,11 @@ from .converter import (
     DataToXLSForm,
     StataToXLSForm,  # Backward compatibility alias
     data_to_xlsform,
+    data_to_xlsform_batch,
     stata_to_xlsform,
-    spss_to_xlsform
+    stata_to_xlsform_batch,
+    spss_to_xlsform,
+    spss_to_xlsform_batch
 )
 
 __version__ = "0.2.0"
@@ -18,6 +21,9 @@ __all__ = [
     "DataToXLSForm",
     "StataToXLSForm",
     "data_to_xlsform",
+    "data_to_xlsform_batch",
     "stata_to_xlsform",
-    "spss_to_xlsform"
+    "stata_to_xlsform_batch",
+    "spss_to_xlsform",
+    "spss_to_xlsform_batch"
 ]
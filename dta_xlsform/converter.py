@@ -7,8 +7,185 @@ XLSForm is a standard for creating forms for data collection tools like ODK and
 
 import pandas as pd
 import pyreadstat
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional
 import os
+import re
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from .xlsx_writer import write_xlsx
+
+try:
+    import polars as pl
+except ImportError:  # Optional: only used with engine='polars'
+    pl = None
+
+
+# Options passed to xlsxwriter.Workbook. Rows are written strictly in order,
+# so constant_memory can flush each one to disk as soon as it is complete.
+# XLSForm cells are plain text, so any per-string inspection (formulas, URLs,
+# numbers) is pure overhead and turned off explicitly. use_zip64 lifts the
+# 4 GB zip limit for very large choices sheets.
+_XLSXWRITER_OPTIONS = {
+    'constant_memory': True,
+    'strings_to_formulas': False,
+    'strings_to_urls': False,
+    'strings_to_numbers': False,
+    'default_date_format': None,
+    'use_zip64': True,
+}
+
+# Encodings tried, in order, when reading Stata files. latin1 decodes any byte
+# sequence, so it is the last resort and never fails.
+_STATA_ENCODINGS = ['utf-8', 'windows-1252', 'latin1']
+
+# XLSForm question type for each readstat storage type (Stata byte, int and long
+# are int8, int16 and int32); strings and any other type are 'text'
+_STORAGE_QUESTION_TYPES = {
+    'int8': 'integer',
+    'int16': 'integer',
+    'int32': 'integer',
+    'float': 'decimal',
+    'double': 'decimal',
+}
+
+# XLSForm question type for each display format pyreadstat converts to dates,
+# datetimes or times (SPSS formats without their width)
+_STATA_TEMPORAL_FORMATS = {
+    '%td': 'date',
+    '%d': 'date',
+    '%tdD_m_Y': 'date',
+    '%tdCCYY-NN-DD': 'date',
+    '%tc': 'datetime',
+    '%tC': 'datetime',
+    '%tcHH:MM:SS': 'time',
+    '%tcHH:MM': 'time',
+}
+_SPSS_TEMPORAL_FORMATS = {
+    'DATE': 'date',
+    'ADATE': 'date',
+    'EDATE': 'date',
+    'JDATE': 'date',
+    'SDATE': 'date',
+    'DATETIME': 'datetime',
+    'YMDHMS': 'datetime',
+    'TIME': 'time',
+    'DTIME': 'time',
+}
+
+# DataFrame libraries the data rows can be read into
+_ENGINES = ('pandas', 'polars')
+
+# Excel writers supported by DataToXLSForm.to_xlsform
+_BACKENDS = ('builtin', 'xlsxwriter', 'openpyxl', 'pyexcelerate')
+
+# Suffix appended to a variable name to form its choice list name
+_LIST_SUFFIX = '_choices'
+
+# XLSForm names may contain letters, digits, '_', '.' and '-' and must start with
+# a letter or '_'. Stata names always qualify; SPSS names may also use '@', '#'
+# and '$', and may start with '@', '#' or '$', which need replacing.
+_INVALID_NAME_RE = re.compile(r'[^\w.\-]')
+_LEADING_NON_LETTER_RE = re.compile(r'^(?=[\d.\-])')
+
+# Column headers of the three XLSForm sheets
+_SURVEY_COLUMNS = ['type', 'name', 'label']
+_CHOICES_COLUMNS = ['list_name', 'name', 'label']
+_SETTINGS_COLUMNS = ['form_title', 'form_id']
+
+# Standard yes/no choices, listed first in every choices sheet
+_YES_NO_CHOICES = [('yes_no', '1', 'Yes'), ('yes_no', '0', 'No')]
+
+
+def _temporal_question_type(var_format: str, file_type: str) -> Optional[str]:
+    """
+    Get the XLSForm question type for a variable displayed as a date or time.
+
+    Args:
+        var_format (str): Display format, e.g. '%td' (Stata) or 'DATE11' (SPSS)
+        file_type (str): Type of file ('stata' or 'spss')
+
+    Returns:
+        Optional[str]: 'date', 'datetime' or 'time', or None for other formats
+    """
+    if file_type == 'stata':
+        return _STATA_TEMPORAL_FORMATS.get(var_format)
+    return _SPSS_TEMPORAL_FORMATS.get(var_format.rstrip('0123456789.'))
+
+
+def _xlsform_names(var_names: Iterable[str]) -> Dict[str, str]:
+    """
+    Map variable names to valid, unique XLSForm names.
+
+    Invalid characters become '_' and names that do not start with a letter or
+    '_' get a leading '_'. Names that are already valid are kept as they are;
+    a changed name that collides with another name gets a numeric suffix.
+
+    Args:
+        var_names (Iterable[str]): Variable names, in file order
+
+    Returns:
+        Dict[str, str]: XLSForm name for each variable
+    """
+    sanitized = {
+        var_name: _LEADING_NON_LETTER_RE.sub('_', _INVALID_NAME_RE.sub('_', var_name))
+        for var_name in var_names
+    }
+    # Reserve valid names first, so only names that had to change are suffixed
+    used = {name for var_name, name in sanitized.items() if name == var_name}
+
+    names = {}
+    for var_name, name in sanitized.items():
+        candidate = name
+        if name != var_name:
+            suffix = 1
+            while candidate in used:
+                suffix += 1
+                candidate = f'{name}_{suffix}'
+            used.add(candidate)
+        names[var_name] = candidate
+    return names
+
+
+def _intern_labels(label_dict: Dict) -> Dict:
+    """
+    Intern the labels of a value label dict in place.
+
+    Codebooks repeat the same labels ("Yes", "No", Likert scales) across many
+    variables; interning keeps a single string object per distinct label.
+
+    Args:
+        label_dict (Dict): Mapping of values to labels
+
+    Returns:
+        Dict: The same dict
+    """
+    for value, label in label_dict.items():
+        if type(label) is str:
+            label_dict[value] = sys.intern(label)
+    return label_dict
+
+
+def _rows_to_frame(rows: Iterable[tuple], columns: List[str]) -> pd.DataFrame:
+    """
+    Build a DataFrame column-wise from row tuples.
+
+    The rows are transposed with zip() and passed to pandas' bulk column
+    constructor, avoiding row-by-row schema inference.
+
+    Args:
+        rows (Iterable[tuple]): Rows with one value per column
+        columns (List[str]): Column names
+
+    Returns:
+        pd.DataFrame: DataFrame with the given columns (possibly empty)
+    """
+    data = list(zip(*rows))
+    if not data:
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame(dict(zip(columns, data)))
 
 
 class DataToXLSForm:
@@ -18,13 +195,17 @@ class DataToXLSForm:
     Attributes:
         file_path (str): Path to the data file (.dta or .sav)
         file_type (str): Type of file ('stata' or 'spss')
-        df (pd.DataFrame): The data from the file
+        df (pd.DataFrame or pl.DataFrame): The data from the file (None if metadata_only)
+        engine (str): DataFrame library the data is read into ('pandas' or 'polars')
+        metadata_only (bool): Whether only the file's metadata was read
         metadata (pyreadstat.metadata_container): Metadata from the file
         variable_labels (Dict[str, str]): Dictionary of variable labels
         value_labels (Dict[str, Dict[int, str]]): Dictionary of value labels
     """
 
-    def __init__(self, file_path: str, file_type: Optional[str] = None):
+    def __init__(self, file_path: str, file_type: Optional[str] = None,
+                 metadata_only: bool = False, num_processes: Optional[int] = None,
+                 engine: str = 'pandas'):
         """
         Initialize the converter with a Stata or SPSS file.
 
@@ -32,19 +213,46 @@ class DataToXLSForm:
             file_path (str): Path to the data file (.dta or .sav)
             file_type (str, optional): File type ('stata' or 'spss').
                                       If None, will be inferred from extension.
+            metadata_only (bool, optional): Read only variable names, types and labels,
+                                            skipping the data rows. Much faster for large
+                                            files; the XLSForm is the same, but `df` is None
+                                            and unique value counts are unavailable.
+            num_processes (int, optional): Number of processes used to read the data rows,
+                                           at most one per CPU core. If None (default),
+                                           the file is read serially. Files that do not
+                                           record their number of rows are read serially,
+                                           with a warning.
+            engine (str, optional): Read the data rows into a 'pandas' (default) or
+                                    'polars' DataFrame. polars counts unique values
+                                    with multithreaded kernels, which is much faster
+                                    for large files, but is an optional dependency.
 
         Raises:
             FileNotFoundError: If the file doesn't exist
-            ValueError: If the file is not a valid Stata or SPSS file
+            ValueError: If the file is not a valid Stata or SPSS file, or the
+                        engine is not supported
+            ImportError: If engine='polars' but polars is not installed
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
+        if engine not in _ENGINES:
+            raise ValueError(f"Unsupported engine: {engine}. "
+                             f"Choose one of {', '.join(_ENGINES)}")
+        if engine == 'polars' and pl is None:
+            raise ImportError("engine='polars' requires polars. "
+                              "Install it with: pip install dta-xlsform[polars]")
 
         self.file_path = file_path
+        self.metadata_only = metadata_only
+        self.num_processes = num_processes
+        self.engine = engine
         self.df = None
         self.metadata = None
         self.variable_labels = {}
         self.value_labels = {}
+        self._types = {}
+        self._names = {}
+        self._nuniques = {}
 
         # Infer file type from extension if not provided
         if file_type is None:
@@ -61,29 +269,63 @@ class DataToXLSForm:
 
         self._read_file()
 
+    @classmethod
+    def from_metadata(cls, file_path: str, file_type: Optional[str] = None) -> 'DataToXLSForm':
+        """
+        Create a converter that reads only the file's metadata, skipping the data rows.
+
+        Equivalent to ``DataToXLSForm(file_path, file_type, metadata_only=True)``.
+        Labels, value labels and the generated XLSForm are the same as for a full read.
+
+        Args:
+            file_path (str): Path to the data file (.dta or .sav)
+            file_type (str, optional): File type ('stata' or 'spss').
+                                      If None, will be inferred from extension.
+
+        Returns:
+            DataToXLSForm: The converter instance
+
+        Example:
+            >>> converter = DataToXLSForm.from_metadata('data.dta')
+            >>> print(converter.value_labels)
+        """
+        return cls(file_path, file_type, metadata_only=True)
+
     def _read_file(self):
         """Read the data file and extract metadata."""
         try:
             if self.file_type == 'stata':
                 # Try reading with different encodings to handle Scandinavian and other special characters
-                encodings = ['utf-8', 'windows-1252', 'iso-8859-1', 'latin1']
+                encodings = _STATA_ENCODINGS
 
                 for encoding in encodings:
                     try:
-                        self.df, self.metadata = pyreadstat.read_dta(
-                            self.file_path,
+                        self.df, self.metadata = self._read_with(
+                            pyreadstat.read_dta,
                             encoding=encoding
                         )
                         break  # If successful, exit the loop
-                    except (UnicodeDecodeError, Exception) as enc_error:
+                    except (UnicodeDecodeError, pyreadstat.ReadstatError) as enc_error:
+                        # Only retry on encoding problems, not on e.g. a corrupt file
+                        if (isinstance(enc_error, pyreadstat.ReadstatError)
+                                and 'encoding' not in str(enc_error)):
+                            raise
                         if encoding == encodings[-1]:  # Last encoding attempt
-                            raise enc_error
+                            raise
                         continue  # Try next encoding
             elif self.file_type == 'spss':
-                self.df, self.metadata = pyreadstat.read_sav(self.file_path)
+                self.df, self.metadata = self._read_with(pyreadstat.read_sav)
             else:
                 raise ValueError(f"Unsupported file type: {self.file_type}")
 
+            # A metadata-only read returns an empty frame with placeholder dtypes
+            if self.metadata_only:
+                self.df = None
+
+            # Cache the question type of every variable so type inference is a dict lookup
+            self._types = self._column_types()
+            self._names = _xlsform_names(self._types)
+
             # Extract variable labels
             if self.metadata.column_names_to_labels:
                 self.variable_labels = self.metadata.column_names_to_labels
@@ -94,108 +336,143 @@ class DataToXLSForm:
                 for var_name, label_value in self.metadata.variable_value_labels.items():
                     if isinstance(label_value, dict):
                         # New format: value labels are directly in variable_value_labels
-                        self.value_labels[var_name] = label_value
+                        self.value_labels[var_name] = _intern_labels(label_value)
                     elif isinstance(label_value, str) and label_value in self.metadata.value_labels:
                         # Old format: variable_value_labels contains label names
-                        self.value_labels[var_name] = self.metadata.value_labels[label_value]
+                        self.value_labels[var_name] = _intern_labels(
+                            self.metadata.value_labels[label_value]
+                        )
 
         except Exception as e:
             raise ValueError(f"Error reading {self.file_type.upper()} file: {str(e)}")
 
-    def _infer_question_type(self, var_name: str, dtype: str) -> str:
+    def _read_with(self, read_function: Callable, **kwargs) -> tuple:
+        """
+        Read the file with a pyreadstat reader, in parallel if num_processes is set.
+
+        Args:
+            read_function (Callable): pyreadstat.read_dta or pyreadstat.read_sav
+            **kwargs: Extra arguments passed on to the reader
+
+        Returns:
+            tuple: (DataFrame, metadata) as returned by the reader
+        """
+        if self.engine == 'polars':
+            kwargs['output_format'] = 'polars'
+
+        num_processes = min(self.num_processes or 1, os.cpu_count() or 1)
+
+        if self.metadata_only or num_processes <= 1:
+            return read_function(self.file_path, metadataonly=self.metadata_only, **kwargs)
+
+        # pyreadstat cannot split a file whose header does not record the number
+        # of rows (some .sav writers omit it); a serial read still handles it
+        _, metadata = read_function(self.file_path, metadataonly=True, **kwargs)
+        if metadata.number_rows is None:
+            warnings.warn(f"{self.file_path} does not record its number of rows, "
+                          "so it is read serially instead of in parallel")
+            return read_function(self.file_path, **kwargs)
+
+        return pyreadstat.read_file_multiprocessing(
+            read_function, self.file_path, num_processes=num_processes, **kwargs
+        )
+
+    def _column_names(self) -> List[str]:
+        """
+        Get the names of all variables, in file order.
+
+        Names come from the file metadata rather than the DataFrame, so they are
+        the same whether or not (and into which library) the rows were read.
+        """
+        return list(self.metadata.column_names)
+
+    def _column_types(self) -> Dict[str, str]:
+        """
+        Get the question type of every variable, ignoring value labels.
+
+        Types come from the storage type and display format recorded in the file,
+        not from DataFrame dtypes. They are the same whether or not the rows were
+        read, and integer variables stay 'integer' even when missing values make
+        pandas load them as floats.
+
+        Returns:
+            Dict[str, str]: Question type per variable, in file order
+        """
+        storage_types = self.metadata.readstat_variable_types
+        display_formats = self.metadata.original_variable_types
+
+        types = {}
+        for var_name in self._column_names():
+            # Dates and times are recognised by their display format
+            temporal_type = _temporal_question_type(display_formats.get(var_name) or '',
+                                                    self.file_type)
+            types[var_name] = temporal_type or _STORAGE_QUESTION_TYPES.get(
+                storage_types.get(var_name), 'text'
+            )
+        return types
+
+    def _infer_question_type(self, var_name: str) -> str:
         """
         Infer XLSForm question type based on variable characteristics.
 
         Args:
             var_name (str): Variable name
-            dtype (str): Data type of the variable
 
         Returns:
             str: XLSForm question type (e.g., 'select_one', 'integer', 'text', 'decimal')
         """
         # If variable has value labels, it's a select_one question
         if var_name in self.value_labels:
-            return f"select_one {var_name}_choices"
-
-        # Infer type from dtype
-        if pd.api.types.is_integer_dtype(self.df[var_name]):
-            return "integer"
-        elif pd.api.types.is_float_dtype(self.df[var_name]):
-            return "decimal"
-        elif pd.api.types.is_bool_dtype(self.df[var_name]):
-            return "select_one yes_no"
-        else:
-            return "text"
+            return "select_one " + self._names[var_name] + _LIST_SUFFIX
 
-    def generate_survey_sheet(self) -> pd.DataFrame:
+        # Otherwise use the type derived from the file's storage type and format
+        return self._types[var_name]
+
+    def _iter_survey_rows(self) -> Iterator[Tuple[str, str, str]]:
         """
-        Generate the 'survey' sheet for XLSForm.
+        Lazily produce the body of the 'survey' sheet.
 
-        Returns:
-            pd.DataFrame: DataFrame containing the survey sheet structure
+        Yields:
+            Tuple[str, str, str]: One (type, name, label) row per variable
         """
-        survey_data = []
+        # Single pass over the variables: type and label are resolved together
+        for var_name in self._types:
+            question_type = self._infer_question_type(var_name)
 
-        for var_name in self.df.columns:
             # Get variable label (question text)
             label = self.variable_labels.get(var_name, var_name)
 
-            # Infer question type
-            question_type = self._infer_question_type(var_name, str(self.df[var_name].dtype))
-
-            survey_data.append({
-                'type': question_type,
-                'name': var_name,
-                'label': label
-            })
-
-        return pd.DataFrame(survey_data)
+            yield question_type, self._names[var_name], label
 
-    def generate_choices_sheet(self) -> pd.DataFrame:
+    def _iter_choices_rows(self) -> Iterator[Tuple[str, str, str]]:
         """
-        Generate the 'choices' sheet for XLSForm.
+        Lazily produce the body of the 'choices' sheet.
 
-        Returns:
-            pd.DataFrame: DataFrame containing the choices sheet structure
+        Yields:
+            Tuple[str, str, str]: One (list_name, name, label) row per choice
         """
-        choices_data = []
-
         # Add standard yes/no choices
-        choices_data.append({
-            'list_name': 'yes_no',
-            'name': '1',
-            'label': 'Yes'
-        })
-        choices_data.append({
-            'list_name': 'yes_no',
-            'name': '0',
-            'label': 'No'
-        })
+        yield from _YES_NO_CHOICES
 
         # Add choices from value labels
         for var_name, value_label_dict in self.value_labels.items():
-            list_name = f"{var_name}_choices"
-
-            for value, label in value_label_dict.items():
-                choices_data.append({
-                    'list_name': list_name,
-                    'name': str(value),
-                    'label': label
-                })
+            list_name = self._names[var_name] + _LIST_SUFFIX
 
-        return pd.DataFrame(choices_data)
+            yield from zip(repeat(list_name),
+                           map(str, value_label_dict.keys()),
+                           value_label_dict.values())
 
-    def generate_settings_sheet(self, form_id: Optional[str] = None,
-                                form_title: Optional[str] = None) -> pd.DataFrame:
+    def _iter_settings_rows(self, form_id: Optional[str] = None,
+                            form_title: Optional[str] = None) -> Iterator[Tuple[str, str]]:
         """
-        Generate the 'settings' sheet for XLSForm.
+        Lazily produce the body of the 'settings' sheet.
 
         Args:
             form_id (str, optional): Unique form identifier
             form_title (str, optional): Human-readable form title
 
-        Returns:
-            pd.DataFrame: DataFrame containing the settings sheet structure
+        Yields:
+            Tuple[str, str]: A single (form_title, form_id) row
         """
         if form_id is None:
             # Use filename without extension as form_id
@@ -204,55 +481,220 @@ class DataToXLSForm:
         if form_title is None:
             form_title = form_id.replace('_', ' ').title()
 
-        settings_data = [{
-            'form_title': form_title,
-            'form_id': form_id
-        }]
+        yield form_title, form_id
 
-        return pd.DataFrame(settings_data)
+    def _iter_sheets(self, form_id: Optional[str] = None,
+                     form_title: Optional[str] = None) -> List[Tuple[str, List[str], Iterator[tuple]]]:
+        """
+        List the XLSForm sheets in the order they are written.
+
+        Args:
+            form_id (str, optional): Unique form identifier
+            form_title (str, optional): Human-readable form title
+
+        Returns:
+            List[Tuple[str, List[str], Iterator[tuple]]]: (sheet name, header, rows) per sheet
+        """
+        return [
+            ('survey', _SURVEY_COLUMNS, self._iter_survey_rows()),
+            ('choices', _CHOICES_COLUMNS, self._iter_choices_rows()),
+            ('settings', _SETTINGS_COLUMNS, self._iter_settings_rows(form_id, form_title)),
+        ]
+
+    def generate_survey_sheet(self) -> pd.DataFrame:
+        """
+        Generate the 'survey' sheet for XLSForm.
+
+        Returns:
+            pd.DataFrame: DataFrame containing the survey sheet structure
+        """
+        return _rows_to_frame(self._iter_survey_rows(), _SURVEY_COLUMNS)
+
+    def generate_choices_sheet(self) -> pd.DataFrame:
+        """
+        Generate the 'choices' sheet for XLSForm.
+
+        Returns:
+            pd.DataFrame: DataFrame containing the choices sheet structure
+        """
+        return _rows_to_frame(self._iter_choices_rows(), _CHOICES_COLUMNS)
+
+    def generate_settings_sheet(self, form_id: Optional[str] = None,
+                                form_title: Optional[str] = None) -> pd.DataFrame:
+        """
+        Generate the 'settings' sheet for XLSForm.
+
+        Args:
+            form_id (str, optional): Unique form identifier
+            form_title (str, optional): Human-readable form title
+
+        Returns:
+            pd.DataFrame: DataFrame containing the settings sheet structure
+        """
+        return _rows_to_frame(self._iter_settings_rows(form_id, form_title),
+                              _SETTINGS_COLUMNS)
 
     def to_xlsform(self, output_path: str, form_id: Optional[str] = None,
-                   form_title: Optional[str] = None):
+                   form_title: Optional[str] = None, backend: str = 'builtin'):
         """
         Generate and save the complete XLSForm Excel file.
 
+        Rows are generated from the variable metadata and value labels and passed
+        straight to the writer, without building DataFrames. With the 'builtin',
+        'xlsxwriter' and 'openpyxl' backends no whole sheet is ever held in memory.
+
         Args:
             output_path (str): Path where the XLSForm Excel file should be saved
             form_id (str, optional): Unique form identifier
             form_title (str, optional): Human-readable form title
-        """
-        # Generate all sheets
-        survey_df = self.generate_survey_sheet()
-        choices_df = self.generate_choices_sheet()
-        settings_df = self.generate_settings_sheet(form_id, form_title)
+            backend (str, optional): Excel writer to use: 'builtin' (default),
+                                     'xlsxwriter', 'openpyxl' or 'pyexcelerate'.
+                                     'builtin' writes the XLSX XML directly and needs
+                                     no Excel library; the others are optional
+                                     dependencies.
 
-        # Write to Excel file with multiple sheets
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            survey_df.to_excel(writer, sheet_name='survey', index=False)
-            choices_df.to_excel(writer, sheet_name='choices', index=False)
-            settings_df.to_excel(writer, sheet_name='settings', index=False)
+        Raises:
+            ValueError: If the backend is not supported
+            ImportError: If the 'xlsxwriter', 'openpyxl' or 'pyexcelerate' backend is
+                         requested but not installed
+        """
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}. "
+                             f"Choose one of {', '.join(_BACKENDS)}")
+
+        if backend == 'builtin':
+            write_xlsx(output_path, self._iter_sheets(form_id, form_title))
+        elif backend == 'xlsxwriter':
+            self._write_xlsxwriter(output_path, form_id, form_title)
+        elif backend == 'openpyxl':
+            self._write_openpyxl(output_path, form_id, form_title)
+        else:
+            self._write_pyexcelerate(output_path, form_id, form_title)
 
         print(f"XLSForm successfully created: {output_path}")
 
-    def get_variable_info(self) -> pd.DataFrame:
+    def _write_xlsxwriter(self, output_path: str, form_id: Optional[str] = None,
+                          form_title: Optional[str] = None):
+        """Stream the XLSForm rows straight into xlsxwriter, bypassing pandas."""
+        try:
+            import xlsxwriter
+        except ImportError:
+            raise ImportError("The 'xlsxwriter' backend requires xlsxwriter. "
+                              "Install it with: pip install dta-xlsform[xlsxwriter]")
+
+        with xlsxwriter.Workbook(output_path, _XLSXWRITER_OPTIONS) as workbook:
+            for sheet_name, header, rows in self._iter_sheets(form_id, form_title):
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, header)
+                for row_num, row in enumerate(rows, start=1):
+                    worksheet.write_row(row_num, 0, row)
+
+    def _write_openpyxl(self, output_path: str, form_id: Optional[str] = None,
+                        form_title: Optional[str] = None):
+        """Stream the XLSForm rows into a write-only openpyxl workbook, bypassing pandas."""
+        try:
+            import openpyxl
+        except ImportError:
+            raise ImportError("The 'openpyxl' backend requires openpyxl. "
+                              "Install it with: pip install dta-xlsform[openpyxl]")
+
+        workbook = openpyxl.Workbook(write_only=True)
+        for sheet_name, header, rows in self._iter_sheets(form_id, form_title):
+            worksheet = workbook.create_sheet(sheet_name)
+            worksheet.append(header)
+            for row in rows:
+                worksheet.append(row)
+        workbook.save(output_path)
+
+    def _write_pyexcelerate(self, output_path: str, form_id: Optional[str] = None,
+                            form_title: Optional[str] = None):
+        """Write the XLSForm with pyexcelerate's bulk sheet writer, bypassing pandas."""
+        try:
+            from pyexcelerate import Workbook
+        except ImportError:
+            raise ImportError("The 'pyexcelerate' backend requires pyexcelerate. "
+                              "Install it with: pip install dta-xlsform[fast]")
+
+        workbook = Workbook()
+        for sheet_name, header, rows in self._iter_sheets(form_id, form_title):
+            workbook.new_sheet(sheet_name, data=[header, *rows])
+        workbook.save(output_path)
+
+    def release_data(self):
+        """
+        Drop the loaded data rows to free memory.
+
+        The XLSForm is generated from the variable metadata and value labels alone,
+        so sheets can still be generated and saved afterwards. Unique value counts
+        already computed by get_variable_info are discarded too; from then on it
+        reports storage types and no counts, as when only metadata was read.
+        """
+        self.df = None
+        self._nuniques = {}
+
+    def _count_unique(self, nunique_sample: Optional[int] = None) -> List[int]:
+        """
+        Count unique values of every variable, scanning the data only once.
+
+        The counts are cached per sample size, so repeated calls to
+        get_variable_info do not rescan the data.
+
+        Args:
+            nunique_sample (int, optional): Count on a random sample of this many rows
+
+        Returns:
+            List[int]: Number of unique values per variable, in column order
+        """
+        if nunique_sample not in self._nuniques:
+            data = self.df
+            if self.engine == 'polars':
+                if nunique_sample is not None and nunique_sample < data.height:
+                    data = data.sample(n=nunique_sample, seed=0)
+                # Missing values are not counted, as with pandas' nunique()
+                counts = data.select(pl.all().drop_nulls().n_unique())
+                self._nuniques[nunique_sample] = list(counts.row(0))
+            else:
+                if nunique_sample is not None and nunique_sample < len(data):
+                    data = data.sample(n=nunique_sample, random_state=0)
+                self._nuniques[nunique_sample] = data.nunique().tolist()
+        return self._nuniques[nunique_sample]
+
+    def get_variable_info(self, nunique_sample: Optional[int] = None) -> pd.DataFrame:
         """
         Get a summary of all variables with their labels and types.
 
+        When only metadata was read, 'type' is the storage type recorded in the
+        file and 'num_unique_values' is None.
+
+        Args:
+            nunique_sample (int, optional): Count unique values in a random sample of
+                                            this many rows instead of all rows. Much
+                                            faster for large files, but counts may be
+                                            lower than the true values.
+
         Returns:
             pd.DataFrame: DataFrame containing variable information
         """
-        info_data = []
-
-        for var_name in self.df.columns:
-            info_data.append({
-                'variable': var_name,
-                'label': self.variable_labels.get(var_name, ''),
-                'type': str(self.df[var_name].dtype),
-                'has_value_labels': var_name in self.value_labels,
-                'num_unique_values': self.df[var_name].nunique()
-            })
+        var_names = self._column_names()
 
-        return pd.DataFrame(info_data)
+        if self.df is None:
+            types = [self.metadata.readstat_variable_types.get(var_name) for var_name in var_names]
+            nuniques = [None] * len(var_names)
+        else:
+            # Dtypes and unique counts come from single whole-frame calls
+            # rather than per-column lookups
+            types = [dtype.name if self.engine == 'pandas' else str(dtype)
+                     for dtype in self.df.dtypes]
+            nuniques = self._count_unique(nunique_sample)
+
+        # Build the frame column-wise
+        return pd.DataFrame({
+            'variable': var_names,
+            'label': [self.variable_labels.get(var_name, '') for var_name in var_names],
+            'type': types,
+            'has_value_labels': [var_name in self.value_labels for var_name in var_names],
+            'num_unique_values': nuniques
+        })
 
 
 # Backward compatibility: Keep old class name as alias
@@ -329,3 +771,93 @@ def spss_to_xlsform(sav_path: str, output_path: str,
         >>> print(converter.get_variable_info())
     """
     return data_to_xlsform(sav_path, output_path, form_id, form_title, file_type='spss')
+
+
+def _convert_job(job: Dict[str, Optional[str]]) -> str:
+    """Convert one batch job in a worker process and return its output path."""
+    # Only metadata is needed to build the form, so the data rows are never read
+    converter = DataToXLSForm(job['file_path'], job.get('file_type'), metadata_only=True)
+    converter.to_xlsform(job['output_path'], job.get('form_id'), job.get('form_title'))
+    return job['output_path']
+
+
+def data_to_xlsform_batch(jobs: Iterable[Dict[str, Optional[str]]],
+                          max_workers: Optional[int] = None) -> List[str]:
+    """
+    Convert several Stata or SPSS files to XLSForm in parallel, one process per file.
+
+    Args:
+        jobs (Iterable[Dict[str, str]]): One dict per file with the arguments of
+                                         `data_to_xlsform`: 'file_path' and 'output_path',
+                                         and optionally 'form_id', 'form_title', 'file_type'
+        max_workers (int, optional): Maximum number of worker processes.
+                                     If None, one per CPU core.
+
+    Returns:
+        List[str]: Paths of the XLSForm files written, in the order of `jobs`
+
+    Example:
+        >>> data_to_xlsform_batch([
+        ...     {'file_path': 'wave1.dta', 'output_path': 'wave1.xlsx'},
+        ...     {'file_path': 'wave2.sav', 'output_path': 'wave2.xlsx'},
+        ... ])
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_convert_job, jobs))
+
+
+def _as_data_jobs(jobs: Iterable[Dict[str, Optional[str]]], path_key: str,
+                  file_type: str) -> Iterator[Dict[str, Optional[str]]]:
+    """Rewrite Stata/SPSS batch jobs as `data_to_xlsform_batch` jobs."""
+    for job in jobs:
+        job = dict(job)
+        job['file_path'] = job.pop(path_key)
+        job['file_type'] = file_type
+        yield job
+
+
+def stata_to_xlsform_batch(jobs: Iterable[Dict[str, Optional[str]]],
+                           max_workers: Optional[int] = None) -> List[str]:
+    """
+    Convert several Stata files to XLSForm in parallel, one process per file.
+
+    Args:
+        jobs (Iterable[Dict[str, str]]): One dict per file with the arguments of
+                                         `stata_to_xlsform`: 'dta_path' and 'output_path',
+                                         and optionally 'form_id', 'form_title'
+        max_workers (int, optional): Maximum number of worker processes.
+                                     If None, one per CPU core.
+
+    Returns:
+        List[str]: Paths of the XLSForm files written, in the order of `jobs`
+
+    Example:
+        >>> stata_to_xlsform_batch([
+        ...     {'dta_path': 'wave1.dta', 'output_path': 'wave1.xlsx'},
+        ...     {'dta_path': 'wave2.dta', 'output_path': 'wave2.xlsx'},
+        ... ])
+    """
+    return data_to_xlsform_batch(_as_data_jobs(jobs, 'dta_path', 'stata'), max_workers)
+
+
+def spss_to_xlsform_batch(jobs: Iterable[Dict[str, Optional[str]]],
+                          max_workers: Optional[int] = None) -> List[str]:
+    """
+    Convert several SPSS files to XLSForm in parallel, one process per file.
+
+    Args:
+        jobs (Iterable[Dict[str, str]]): One dict per file with the arguments of
+                                         `spss_to_xlsform`: 'sav_path' and 'output_path',
+                                         and optionally 'form_id', 'form_title'
+        max_workers (int, optional): Maximum number of worker processes.
+                                     If None, one per CPU core.
+
+    Returns:
+        List[str]: Paths of the XLSForm files written, in the order of `jobs`
+
+    Example:
+        >>> spss_to_xlsform_batch([
+        ...     {'sav_path': 'staff.sav', 'output_path': 'staff.xlsx'},
+        ... ])
+    """
+    return data_to_xlsform_batch(_as_data_jobs(jobs, 'sav_path', 'spss'), max_workers)
@@ -0,0 +1,200 @@
+"""
+Minimal XLSX writer
+
+Writes workbooks made only of text cells, which is all an XLSForm needs, by
+generating the Office Open XML parts directly and zipping them. Rows are
+streamed into the archive as they are produced; only the shared strings
+table, one entry per distinct text, is kept in memory. Choice labels such as
+"Yes" and "No" repeat across many lists, so each is stored once and cells
+refer to it by index.
+"""
+
+import io
+import re
+import zipfile
+from itertools import chain
+from typing import Dict, Iterable, List, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+
+_CONTENT_TYPES_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+)
+_CONTENT_TYPES_SHEET = (
+    '<Override PartName="/xl/worksheets/sheet{index}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>'
+)
+_WORKBOOK_SHEET = '<sheet name={name} sheetId="{index}" r:id="rId{index}"/>'
+_WORKBOOK_TAIL = '</sheets></workbook>'
+
+_WORKBOOK_RELS_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+)
+_WORKBOOK_RELS_SHEET = (
+    '<Relationship Id="rId{index}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{index}.xml"/>'
+)
+_WORKBOOK_RELS_STYLES = (
+    '<Relationship Id="rId{index}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '<Relationship Id="rId{shared_strings_index}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+    'Target="sharedStrings.xml"/>'
+    '</Relationships>'
+)
+
+# The smallest stylesheet Excel accepts: one font, the two mandatory fills,
+# one border and the default cell format
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+_SHARED_STRINGS_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'uniqueCount="{unique_count}">'
+)
+_SHARED_STRINGS_TAIL = '</sst>'
+
+# Deflate level for the archive. Level 1 is several times faster than zlib's
+# default of 6 and, on repetitive sheet XML, only slightly larger
+_COMPRESS_LEVEL = 1
+
+# Control characters are not allowed in XML; Excel stores them as _xHHHH_
+_ILLEGAL_XML_CHARS_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _column_letter(index: int) -> str:
+    """Convert a 0-based column index to its Excel column letters (0 -> 'A')."""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell_text(value) -> str:
+    """Escape a cell value for use as XML element text."""
+    text = escape(str(value))
+    if _ILLEGAL_XML_CHARS_RE.search(text):
+        text = _ILLEGAL_XML_CHARS_RE.sub(lambda m: '_x%04X_' % ord(m.group()), text)
+    return text
+
+
+def _shared_string_xml(value: str) -> str:
+    """Render one entry of the shared strings table."""
+    text = _cell_text(value)
+    # Keep leading/trailing spaces, which XML would otherwise collapse
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<si><t{space}>{text}</t></si>'
+
+
+def _row_xml(row_num: int, row: Iterable, columns: List[str],
+             shared_strings: Dict[str, int]) -> str:
+    """
+    Render one row of shared-string cells; None values are left empty.
+
+    Values not yet in shared_strings are added to it, numbered in order of
+    first appearance.
+    """
+    cells = []
+    for column, value in zip(columns, row):
+        if value is None:
+            continue
+        index = shared_strings.setdefault(str(value), len(shared_strings))
+        cells.append(f'<c r="{column}{row_num}" t="s"><v>{index}</v></c>')
+    return f'<row r="{row_num}">{"".join(cells)}</row>'
+
+
+def write_xlsx(output_path: str, sheets: List[Tuple[str, List[str], Iterable[tuple]]]):
+    """
+    Write an XLSX workbook of text cells.
+
+    Args:
+        output_path (str): Path where the workbook should be saved
+        sheets (List[Tuple[str, List[str], Iterable[tuple]]]): (sheet name, header, rows)
+            per sheet, in workbook order. Rows may be a lazy iterator.
+    """
+    names = [name for name, _, _ in sheets]
+
+    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED,
+                         compresslevel=_COMPRESS_LEVEL) as archive:
+        archive.writestr('[Content_Types].xml', _CONTENT_TYPES_HEAD + ''.join(
+            _CONTENT_TYPES_SHEET.format(index=index)
+            for index in range(1, len(names) + 1)
+        ) + '</Types>')
+        archive.writestr('_rels/.rels', _ROOT_RELS)
+        archive.writestr('xl/workbook.xml', _WORKBOOK_HEAD + ''.join(
+            _WORKBOOK_SHEET.format(name=quoteattr(name), index=index)
+            for index, name in enumerate(names, start=1)
+        ) + _WORKBOOK_TAIL)
+        archive.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS_HEAD + ''.join(
+            _WORKBOOK_RELS_SHEET.format(index=index)
+            for index in range(1, len(names) + 1)
+        ) + _WORKBOOK_RELS_STYLES.format(index=len(names) + 1,
+                                         shared_strings_index=len(names) + 2))
+        archive.writestr('xl/styles.xml', _STYLES)
+
+        shared_strings = {}
+        for index, (_, header, rows) in enumerate(sheets, start=1):
+            columns = [_column_letter(i) for i in range(len(header))]
+            with io.TextIOWrapper(archive.open(f'xl/worksheets/sheet{index}.xml', 'w'),
+                                  encoding='utf-8') as stream:
+                stream.write(_SHEET_HEAD)
+                for row_num, row in enumerate(chain([header], rows), start=1):
+                    stream.write(_row_xml(row_num, row, columns, shared_strings))
+                stream.write(_SHEET_TAIL)
+
+        # The table is only complete once every sheet has been written
+        with io.TextIOWrapper(archive.open('xl/sharedStrings.xml', 'w'),
+                              encoding='utf-8') as stream:
+            stream.write(_SHARED_STRINGS_HEAD.format(unique_count=len(shared_strings)))
+            for value in shared_strings:
+                stream.write(_shared_string_xml(value))
+            stream.write(_SHARED_STRINGS_TAIL)
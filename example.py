@@ -4,13 +4,20 @@ Example usage of the dta_xlsform library
 Demonstrates converting both Stata (.dta) and SPSS (.sav) files to XLSForm format.
 """
 
+from itertools import islice
+
 from dta_xlsform import (
     stata_to_xlsform,
     spss_to_xlsform,
     data_to_xlsform,
+    data_to_xlsform_batch,
+    stata_to_xlsform_batch,
     DataToXLSForm
 )
 
+# Maximum number of entries printed when previewing metadata
+PREVIEW_ROWS = 20
+
 
 def example_1_simple_stata_conversion():
     """Simple one-line Stata conversion"""
@@ -85,7 +92,7 @@ def example_4_detailed_stata_usage():
     # Inspect variable information
     print("\nVariable Information:")
     var_info = converter.get_variable_info()
-    print(var_info.to_string())
+    print(var_info.to_string(max_rows=PREVIEW_ROWS))
     print()
 
     # Preview survey sheet
@@ -100,6 +107,9 @@ def example_4_detailed_stata_usage():
     print(choices_df.head(10).to_string())
     print()
 
+    # The data rows are no longer needed; free them before writing
+    converter.release_data()
+
     # Generate the XLSForm
     converter.to_xlsform(
         output_path='output_form.xlsx',
@@ -123,12 +133,12 @@ def example_5_detailed_spss_usage():
     # Inspect variable information
     print("\nVariable Information:")
     var_info = converter.get_variable_info()
-    print(var_info.to_string())
+    print(var_info.to_string(max_rows=PREVIEW_ROWS))
     print()
 
     # Access value labels
     print("\nCategorical Variables:")
-    for var_name, labels in converter.value_labels.items():
+    for var_name, labels in islice(converter.value_labels.items(), PREVIEW_ROWS):
         print(f"  {var_name}: {len(labels)} categories")
     print()
 
@@ -147,24 +157,72 @@ def example_6_inspect_metadata():
     print("Example 6: Inspect metadata only")
     print("-" * 50)
 
-    # Works with both Stata and SPSS
-    converter = DataToXLSForm('your_data.dta')  # or 'your_data.sav'
+    # Works with both Stata and SPSS. Only metadata is needed here,
+    # so the data rows are not read at all.
+    converter = DataToXLSForm.from_metadata('your_data.dta')  # or 'your_data.sav'
 
     # Access variable labels
     print("Variable Labels:")
-    for var_name, label in converter.variable_labels.items():
+    for var_name, label in islice(converter.variable_labels.items(), PREVIEW_ROWS):
         print(f"  {var_name}: {label}")
     print()
 
     # Access value labels
     print("\nValue Labels:")
-    for var_name, value_dict in converter.value_labels.items():
+    for var_name, value_dict in islice(converter.value_labels.items(), PREVIEW_ROWS):
         print(f"  {var_name}:")
-        for value, label in value_dict.items():
+        for value, label in islice(value_dict.items(), PREVIEW_ROWS):
             print(f"    {value}: {label}")
     print()
 
 
+def example_7_batch_conversion():
+    """Convert many files in parallel"""
+    print("Example 7: Batch conversion")
+    print("-" * 50)
+
+    # Each file is converted in its own process, one per CPU core.
+    # Keep this call under `if __name__ == "__main__":` (as below),
+    # which process pools require on Windows and macOS.
+    outputs = data_to_xlsform_batch([
+        {'file_path': 'wave1.dta', 'output_path': 'wave1_form.xlsx'},
+        {'file_path': 'wave2.dta', 'output_path': 'wave2_form.xlsx'},
+        {'file_path': 'staff.sav', 'output_path': 'staff_form.xlsx',
+         'form_title': 'Staff Survey'},
+    ])
+
+    print(f"Created {len(outputs)} forms")
+
+    # Stata-only batches can use the same arguments as stata_to_xlsform
+    outputs = stata_to_xlsform_batch([
+        {'dta_path': 'wave1.dta', 'output_path': 'wave1_form.xlsx'},
+        {'dta_path': 'wave2.dta', 'output_path': 'wave2_form.xlsx',
+         'form_id': 'wave2_2024'},
+    ])
+
+    print(f"Created {len(outputs)} Stata forms\n")
+
+
+def example_8_polars_engine():
+    """Inspect a large file using polars"""
+    print("Example 8: Variable inspection with polars")
+    print("-" * 50)
+
+    # Requires: pip install dta-xlsform[polars]
+    # The data is read into a polars DataFrame, whose multithreaded kernels
+    # count unique values much faster than pandas on large files
+    converter = DataToXLSForm('large_panel.dta', engine='polars')
+
+    var_info = converter.get_variable_info()
+    print(var_info.to_string(max_rows=PREVIEW_ROWS))
+    print()
+
+    converter.release_data()
+    converter.to_xlsform('large_panel_form.xlsx')
+
+    print("\nConversion complete!\n")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("dta_xlsform - Stata & SPSS to XLSForm Converter - Examples")
@@ -180,6 +238,8 @@ if __name__ == "__main__":
     # example_4_detailed_stata_usage()
     # example_5_detailed_spss_usage()
     # example_6_inspect_metadata()
+    # example_7_batch_conversion()
+    # example_8_polars_engine()
 
     print("\nNote: Replace 'your_data.dta' or 'your_data.sav' with your actual file paths!")
     print("The library supports both Stata (.dta) and SPSS (.sav) files.")
@@ -24,6 +24,11 @@ setup(
     install_requires=[
         "pandas>=1.3.0",
         "pyreadstat>=1.1.0",
-        "openpyxl>=3.0.0",
     ],
+    extras_require={
+        "fast": ["pyexcelerate>=0.10.0"],
+        "openpyxl": ["openpyxl>=3.0.0"],
+        "xlsxwriter": ["xlsxwriter>=1.2.3"],
+        "polars": ["polars>=0.20.0", "pyreadstat>=1.3.0"],
+    },
 )